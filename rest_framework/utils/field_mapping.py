@@ -2,7 +2,7 @@
 Helper functions for mapping model fields to a dictionary of default
 keyword arguments that should be used for their equivalent serializer fields.
 """
-import inspect
+from functools import lru_cache
 
 from django.core import validators
 from django.db import models
@@ -15,6 +15,14 @@ NUMERIC_FIELD_TYPES = (
     models.IntegerField, models.FloatField, models.DecimalField, models.DurationField,
 )
 
+TEXT_FIELD_TYPES = (models.CharField, models.TextField)
+
+MAX_LENGTH_FIELD_TYPES = (models.CharField, models.TextField, models.FileField)
+
+TEXTAREA_FIELD_TYPES = (models.TextField,)
+if postgres_fields:
+    TEXTAREA_FIELD_TYPES += (postgres_fields.JSONField,)
+
 
 class ClassLookupDict:
     """
@@ -22,25 +30,59 @@ class ClassLookupDict:
     Lookups against this object will traverses the object's inheritance
     hierarchy in method resolution order, and returns the first matching value
     from the dictionary or raises a KeyError if nothing matches.
+
+    Results are cached per class. The cache is cleared when items are set on
+    this object, but not when the underlying `mapping` is modified directly.
     """
+    __slots__ = ('mapping', '_cache')
+
     def __init__(self, mapping):
         self.mapping = mapping
+        self._cache = {}
 
     def __getitem__(self, key):
-        if hasattr(key, '_proxy_class'):
-            # Deal with proxy classes. Ie. BoundField behaves as if it
-            # is a Field instance when using ClassLookupDict.
-            base_class = key._proxy_class
-        else:
-            base_class = key.__class__
-
-        for cls in inspect.getmro(base_class):
+        # Deal with proxy classes. Ie. BoundField behaves as if it
+        # is a Field instance when using ClassLookupDict.
+        base_class = getattr(key, '_proxy_class', None) or type(key)
+
+        try:
+            return self._cache[base_class]
+        except KeyError:
+            pass
+
+        for cls in base_class.__mro__:
             if cls in self.mapping:
-                return self.mapping[cls]
+                value = self.mapping[cls]
+                self._cache[base_class] = value
+                return value
         raise KeyError('Class %s not found in lookup.' % base_class.__name__)
 
     def __setitem__(self, key, value):
         self.mapping[key] = value
+        self._cache.clear()
+
+
+# Maps model field classes onto a check for the validators that the model
+# field includes by default, and which should not be passed through to the
+# serializer field.
+DEFAULT_VALIDATOR_LOOKUP = ClassLookupDict({
+    models.Field: None,
+    models.URLField: lambda validator: isinstance(validator, validators.URLValidator),
+    models.EmailField: lambda validator: validator is validators.validate_email,
+    models.SlugField: lambda validator: validator is validators.validate_slug,
+    models.GenericIPAddressField: lambda validator: validator is validators.validate_ipv46_address,
+    models.DecimalField: lambda validator: isinstance(validator, validators.DecimalValidator),
+})
+
+# Maps validator classes onto the serializer field keyword argument that
+# should be used in their place.
+LIMIT_VALIDATOR_LOOKUP = ClassLookupDict({
+    object: None,
+    validators.MaxValueValidator: 'max_value',
+    validators.MinValueValidator: 'min_value',
+    validators.MaxLengthValidator: 'max_length',
+    validators.MinLengthValidator: 'min_length',
+})
 
 
 def needs_label(model_field, field_name):
@@ -52,67 +94,93 @@ def needs_label(model_field, field_name):
     return capfirst(model_field.verbose_name) != default_label
 
 
+def get_label(model_field, field_name):
+    """
+    Returns the label based on the model's verbose name, or `None` if it
+    is equal to the default label it would have based on it's field name.
+    """
+    if not model_field.verbose_name:
+        return None
+    label = capfirst(model_field.verbose_name)
+    if label == field_name.replace('_', ' ').capitalize():
+        return None
+    return label
+
+
+@lru_cache(maxsize=None)
 def get_detail_view_name(model):
     """
     Given a model class, return the view name to use for URL relationships
     that refer to instances of the model.
     """
-    return '%(model_name)s-detail' % {
-        'app_label': model._meta.app_label,
-        'model_name': model._meta.object_name.lower()
-    }
+    return '%s-detail' % model._meta.object_name.lower()
 
 
 def get_field_kwargs(field_name, model_field):
     """
     Creates a default instance of a basic non-relational field.
     """
-    kwargs = {}
-    validator_kwarg = list(model_field.validators)
+    # Type checks against the model field are made as set membership tests
+    # on its class hierarchy, which is cheaper than repeated isinstance calls.
+    field_classes = set(type(model_field).__mro__)
 
-    # The following will only be used by ModelField classes.
-    # Gets removed for everything else.
-    kwargs['model_field'] = model_field
+    kwargs = {
+        # The following will only be used by ModelField classes.
+        # Gets removed for everything else.
+        'model_field': model_field,
+    }
 
-    if model_field.verbose_name and needs_label(model_field, field_name):
-        kwargs['label'] = capfirst(model_field.verbose_name)
+    label = get_label(model_field, field_name)
+    if label is not None:
+        kwargs['label'] = label
 
-    if model_field.help_text:
-        kwargs['help_text'] = model_field.help_text
+    help_text = model_field.help_text
+    if help_text:
+        kwargs['help_text'] = help_text
 
-    max_digits = getattr(model_field, 'max_digits', None)
-    if max_digits is not None:
-        kwargs['max_digits'] = max_digits
+    # This check uses `isinstance` rather than `field_classes`, since from
+    # Django 3.0 `AutoFieldMeta.__instancecheck__` counts `BigAutoField` and
+    # `SmallAutoField` as `AutoField` even though it is not in their MRO.
+    if isinstance(model_field, models.AutoField):
+        # Auto fields are always read-only, and none of the type specific
+        # keyword arguments below apply to them, so return early.
+        kwargs['read_only'] = True
+        return kwargs
 
-    decimal_places = getattr(model_field, 'decimal_places', None)
-    if decimal_places is not None:
-        kwargs['decimal_places'] = decimal_places
+    if models.DecimalField in field_classes:
+        if model_field.max_digits is not None:
+            kwargs['max_digits'] = model_field.max_digits
+        if model_field.decimal_places is not None:
+            kwargs['decimal_places'] = model_field.decimal_places
 
-    if isinstance(model_field, models.SlugField):
+    if models.SlugField in field_classes:
         kwargs['allow_unicode'] = model_field.allow_unicode
 
-    if isinstance(model_field, models.TextField) or (postgres_fields and isinstance(model_field, postgres_fields.JSONField)):
+    if not field_classes.isdisjoint(TEXTAREA_FIELD_TYPES):
         kwargs['style'] = {'base_template': 'textarea.html'}
 
-    if isinstance(model_field, models.AutoField) or not model_field.editable:
+    if not model_field.editable:
         # If this field is read-only, then return early.
         # Further keyword arguments are not valid.
         kwargs['read_only'] = True
         return kwargs
 
-    if model_field.has_default() or model_field.blank or model_field.null:
+    null = model_field.null
+    blank = model_field.blank
+
+    if null or blank or model_field.has_default():
         kwargs['required'] = False
 
-    if model_field.null and not isinstance(model_field, models.NullBooleanField):
+    if null and models.NullBooleanField not in field_classes:
         kwargs['allow_null'] = True
 
-    if model_field.blank and (isinstance(model_field, (models.CharField, models.TextField))):
+    if blank and not field_classes.isdisjoint(TEXT_FIELD_TYPES):
         kwargs['allow_blank'] = True
 
-    if not model_field.blank and (postgres_fields and isinstance(model_field, postgres_fields.ArrayField)):
+    if not blank and (postgres_fields and postgres_fields.ArrayField in field_classes):
         kwargs['allow_empty'] = False
 
-    if isinstance(model_field, models.FilePathField):
+    if models.FilePathField in field_classes:
         kwargs['path'] = model_field.path
 
         if model_field.match is not None:
@@ -127,107 +195,71 @@ def get_field_kwargs(field_name, model_field):
         if model_field.allow_folders is not False:
             kwargs['allow_folders'] = model_field.allow_folders
 
-    if model_field.choices:
-        kwargs['choices'] = model_field.choices
-    else:
-        # Ensure that max_value is passed explicitly as a keyword arg,
-        # rather than as a validator.
-        max_value = next((
-            validator.limit_value for validator in validator_kwarg
-            if isinstance(validator, validators.MaxValueValidator)
-        ), None)
-        if max_value is not None and isinstance(model_field, NUMERIC_FIELD_TYPES):
-            kwargs['max_value'] = max_value
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if not isinstance(validator, validators.MaxValueValidator)
-            ]
-
-        # Ensure that min_value is passed explicitly as a keyword arg,
-        # rather than as a validator.
-        min_value = next((
-            validator.limit_value for validator in validator_kwarg
-            if isinstance(validator, validators.MinValueValidator)
-        ), None)
-        if min_value is not None and isinstance(model_field, NUMERIC_FIELD_TYPES):
-            kwargs['min_value'] = min_value
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if not isinstance(validator, validators.MinValueValidator)
-            ]
-
-        # URLField does not need to include the URLValidator argument,
-        # as it is explicitly added in.
-        if isinstance(model_field, models.URLField):
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if not isinstance(validator, validators.URLValidator)
-            ]
-
-        # EmailField does not need to include the validate_email argument,
-        # as it is explicitly added in.
-        if isinstance(model_field, models.EmailField):
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if validator is not validators.validate_email
-            ]
-
-        # SlugField do not need to include the 'validate_slug' argument,
-        if isinstance(model_field, models.SlugField):
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if validator is not validators.validate_slug
-            ]
-
-        # IPAddressField do not need to include the 'validate_ipv46_address' argument,
-        if isinstance(model_field, models.GenericIPAddressField):
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if validator is not validators.validate_ipv46_address
-            ]
-        # Our decimal validation is handled in the field code, not validator code.
-        if isinstance(model_field, models.DecimalField):
-            validator_kwarg = [
-                validator for validator in validator_kwarg
-                if not isinstance(validator, validators.DecimalValidator)
-            ]
+    # Most fields, such as a plain integer or boolean field, have no
+    # validators, choices or length limits. None of the remaining keyword
+    # arguments apply to them, so return early.
+    model_validators = model_field.validators
+    choices = model_field.choices
+    unique = model_field.unique
+    if not (model_validators or choices or unique) and field_classes.isdisjoint(MAX_LENGTH_FIELD_TYPES):
+        return kwargs
 
     # Ensure that max_length is passed explicitly as a keyword arg,
     # rather than as a validator.
-    max_length = getattr(model_field, 'max_length', None)
-    if max_length is not None and (isinstance(model_field, (models.CharField, models.TextField, models.FileField))):
-        kwargs['max_length'] = max_length
-        validator_kwarg = [
-            validator for validator in validator_kwarg
-            if not isinstance(validator, validators.MaxLengthValidator)
-        ]
-
-    # Ensure that min_length is passed explicitly as a keyword arg,
-    # rather than as a validator.
-    min_length = next((
-        validator.limit_value for validator in validator_kwarg
-        if isinstance(validator, validators.MinLengthValidator)
-    ), None)
-    if min_length is not None and isinstance(model_field, models.CharField):
-        kwargs['min_length'] = min_length
-        validator_kwarg = [
-            validator for validator in validator_kwarg
-            if not isinstance(validator, validators.MinLengthValidator)
-        ]
-
-    if getattr(model_field, 'unique', False):
+    strip_max_length = not field_classes.isdisjoint(MAX_LENGTH_FIELD_TYPES) and model_field.max_length is not None
+    if strip_max_length:
+        kwargs['max_length'] = model_field.max_length
+
+    # Ensure that min_length, max_value and min_value are passed explicitly
+    # as keyword args, rather than as validators. Validators that duplicate
+    # the serializer field's own validation are dropped in the same pass.
+    limit_kwargs = set()
+    if strip_max_length:
+        limit_kwargs.add('max_length')
+    if models.CharField in field_classes:
+        limit_kwargs.add('min_length')
+    if choices:
+        kwargs['choices'] = choices
+        is_default_validator = None
+    else:
+        if not field_classes.isdisjoint(NUMERIC_FIELD_TYPES):
+            limit_kwargs.update(('max_value', 'min_value'))
+        is_default_validator = DEFAULT_VALIDATOR_LOOKUP[model_field]
+
+    # Only build a new list of validators if some of them may be dropped.
+    validator_kwarg = model_validators
+    if model_validators and (limit_kwargs or is_default_validator is not None):
+        validator_kwarg = []
+        for validator in model_validators:
+            limit_kwarg = LIMIT_VALIDATOR_LOOKUP[validator]
+            if limit_kwarg in limit_kwargs:
+                # The first validator of each kind sets the limit, except for
+                # max_length which is always taken from the model field.
+                kwargs.setdefault(limit_kwarg, validator.limit_value)
+            elif is_default_validator is None or not is_default_validator(validator):
+                validator_kwarg.append(validator)
+
+    if unique:
+        # A new validator is created on each call, rather than being cached,
+        # since `UniqueValidator` holds per-serializer state once its context
+        # is set, and the error message is rendered in the active language.
+        model = model_field.model
         unique_error_message = model_field.error_messages.get('unique', None)
         if unique_error_message:
             unique_error_message = unique_error_message % {
-                'model_name': model_field.model._meta.verbose_name,
+                'model_name': model._meta.verbose_name,
                 'field_label': model_field.verbose_name
             }
         validator = UniqueValidator(
-            queryset=model_field.model._default_manager,
+            queryset=model._default_manager,
             message=unique_error_message)
-        validator_kwarg.append(validator)
+        validator_kwarg = validator_kwarg + [validator]
 
     if validator_kwarg:
+        # Never hand out the model field's own list of validators,
+        # as the serializer field may modify it.
+        if validator_kwarg is model_validators:
+            validator_kwarg = list(validator_kwarg)
         kwargs['validators'] = validator_kwarg
 
     return kwargs
@@ -238,8 +270,8 @@ def get_relation_kwargs(field_name, relation_info):
     Creates a default instance of a flat relational field.
     """
     model_field, related_model, to_many, to_field, has_through_model, reverse = relation_info
+    read_only = has_through_model or (model_field is not None and not model_field.editable)
     kwargs = {
-        'queryset': related_model._default_manager,
         'view_name': get_detail_view_name(related_model)
     }
 
@@ -249,50 +281,51 @@ def get_relation_kwargs(field_name, relation_info):
     if to_field:
         kwargs['to_field'] = to_field
 
-    limit_choices_to = model_field and model_field.get_limit_choices_to()
-    if limit_choices_to:
-        if not isinstance(limit_choices_to, models.Q):
-            limit_choices_to = models.Q(**limit_choices_to)
-        kwargs['queryset'] = kwargs['queryset'].filter(limit_choices_to)
-
-    if has_through_model:
+    if read_only:
         kwargs['read_only'] = True
-        kwargs.pop('queryset', None)
+    else:
+        queryset = related_model._default_manager
+        limit_choices_to = model_field and model_field.get_limit_choices_to()
+        if limit_choices_to:
+            if not isinstance(limit_choices_to, models.Q):
+                limit_choices_to = models.Q(**limit_choices_to)
+            queryset = queryset.filter(limit_choices_to)
+        kwargs['queryset'] = queryset
 
     if model_field:
-        if model_field.verbose_name and needs_label(model_field, field_name):
-            kwargs['label'] = capfirst(model_field.verbose_name)
+        label = get_label(model_field, field_name)
+        if label is not None:
+            kwargs['label'] = label
         help_text = model_field.help_text
         if help_text:
             kwargs['help_text'] = help_text
-        if not model_field.editable:
-            kwargs['read_only'] = True
-            kwargs.pop('queryset', None)
-        if kwargs.get('read_only', False):
+        if read_only:
             # If this field is read-only, then return early.
             # No further keyword arguments are valid.
             return kwargs
 
-        if model_field.has_default() or model_field.blank or model_field.null:
+        null = model_field.null
+        blank = model_field.blank
+        if null or blank or model_field.has_default():
             kwargs['required'] = False
-        if model_field.null:
+        if null:
             kwargs['allow_null'] = True
-        if model_field.validators:
-            kwargs['validators'] = model_field.validators
-        if getattr(model_field, 'unique', False):
+        model_validators = model_field.validators
+        if model_validators:
+            kwargs['validators'] = model_validators
+        if model_field.unique:
             validator = UniqueValidator(queryset=model_field.model._default_manager)
             kwargs['validators'] = kwargs.get('validators', []) + [validator]
-        if to_many and not model_field.blank:
+        if to_many and not blank:
             kwargs['allow_empty'] = False
 
     return kwargs
 
 
 def get_nested_relation_kwargs(relation_info):
-    kwargs = {'read_only': True}
     if relation_info.to_many:
-        kwargs['many'] = True
-    return kwargs
+        return {'read_only': True, 'many': True}
+    return {'read_only': True}
 
 
 def get_url_kwargs(model_field):
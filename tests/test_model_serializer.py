@@ -356,6 +356,73 @@ class TestRegularFieldMappings(TestCase):
 
         ExampleSerializer()
 
+    def test_subclassed_fields_omit_default_validators(self):
+        """
+        Validators that model fields add by default should not be included
+        for subclasses of those model fields either.
+        """
+        class CustomURLField(models.URLField):
+            pass
+
+        class CustomSlugField(models.SlugField):
+            pass
+
+        class SubclassedFieldsModel(models.Model):
+            url_field = CustomURLField(max_length=100)
+            slug_field = CustomSlugField(max_length=100)
+
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = SubclassedFieldsModel
+                fields = '__all__'
+
+        expected = dedent("""
+            TestSerializer():
+                id = IntegerField(label='ID', read_only=True)
+                url_field = URLField(max_length=100)
+                slug_field = SlugField(allow_unicode=False, max_length=100)
+        """)
+        self.assertEqual(repr(TestSerializer()), expected)
+
+    def test_big_auto_field_is_read_only(self):
+        """
+        `BigAutoField` primary keys should map to read-only fields,
+        in the same way as `AutoField`.
+        """
+        class BigAutoFieldModel(models.Model):
+            id = models.BigAutoField(primary_key=True)
+
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = BigAutoFieldModel
+                fields = '__all__'
+
+        expected = dedent("""
+            TestSerializer():
+                id = IntegerField(read_only=True)
+        """)
+        self.assertEqual(repr(TestSerializer()), expected)
+
+    @pytest.mark.skipif(django.VERSION < (3, 0), reason='Django version < 3.0')
+    def test_small_auto_field_is_read_only(self):
+        """
+        `SmallAutoField` primary keys should map to read-only fields,
+        in the same way as `AutoField`.
+        """
+        class SmallAutoFieldModel(models.Model):
+            id = models.SmallAutoField(primary_key=True)
+
+        class TestSerializer(serializers.ModelSerializer):
+            class Meta:
+                model = SmallAutoFieldModel
+                fields = '__all__'
+
+        expected = dedent("""
+            TestSerializer():
+                id = IntegerField(read_only=True)
+        """)
+        self.assertEqual(repr(TestSerializer()), expected)
+
 
 class TestDurationFieldMapping(TestCase):
     def test_duration_field(self):
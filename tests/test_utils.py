@@ -8,6 +8,9 @@ from rest_framework.routers import SimpleRouter
 from rest_framework.serializers import ModelSerializer
 from rest_framework.utils import json
 from rest_framework.utils.breadcrumbs import get_breadcrumbs
+from rest_framework.utils.field_mapping import (
+    ClassLookupDict, get_label, needs_label
+)
 from rest_framework.utils.formatting import lazy_format
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 from rest_framework.views import APIView
@@ -267,3 +270,37 @@ class LazyFormatTests(TestCase):
         assert message.format.call_count == 1
         str(formatted)
         assert message.format.call_count == 1
+
+
+class ClassLookupDictTests(TestCase):
+    def test_lookup_follows_mro(self):
+        lookup = ClassLookupDict({int: 'int', object: 'object'})
+        assert lookup[True] == 'int'
+        assert lookup['text'] == 'object'
+
+    def test_setitem_invalidates_cached_lookups(self):
+        lookup = ClassLookupDict({int: 'int'})
+        assert lookup[True] == 'int'
+        lookup[bool] = 'bool'
+        assert lookup[True] == 'bool'
+
+    def test_missing_class_raises_key_error(self):
+        lookup = ClassLookupDict({int: 'int'})
+        with self.assertRaisesMessage(KeyError, 'Class str not found in lookup.'):
+            lookup['text']
+
+
+class LabelTests(TestCase):
+    def test_needs_label(self):
+        field = mock.Mock(verbose_name='a label')
+        assert needs_label(field, 'a_label') is False
+        assert needs_label(field, 'other') is True
+
+    def test_needs_label_with_empty_verbose_name(self):
+        field = mock.Mock(verbose_name='')
+        assert needs_label(field, 'a_label') is True
+
+    def test_get_label(self):
+        field = mock.Mock(verbose_name='a label')
+        assert get_label(field, 'a_label') is None
+        assert get_label(field, 'other') == 'A label'